@@ -30,10 +30,7 @@ def to_avro_record(name, fields, description, namespace) -> dict:
 
 
 def to_avro_fields(fields):
-    result = []
-    for field_name, field in fields.items():
-        result.append(to_avro_field(field, field_name))
-    return result
+    return [to_avro_field(field, field_name) for field_name, field in fields.items()]
 
 
 def to_avro_field(field, field_name):
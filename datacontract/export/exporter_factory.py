@@ -15,8 +15,7 @@ class ExporterFactory:
         self.dict_lazy_exporter.update({name: (module_path, class_name)})
 
     def create(self, name) -> Exporter:
-        exporters = self.dict_exporter.copy()
-        exporters.update(self.dict_lazy_exporter.copy())
+        exporters = {**self.dict_exporter, **self.dict_lazy_exporter}
         if name not in exporters.keys():
             raise ValueError(f"The '{name}' format is not supported.")
         exporter_class = exporters[name]
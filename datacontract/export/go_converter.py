@@ -1,8 +1,12 @@
 import datacontract.model.data_contract_specification as spec
+from functools import lru_cache
 from typing import List
 import re
 from datacontract.export.exporter import Exporter
 
+# splits snake_case and CamelCase names into their words
+_CAMEL_CASE_SPLIT_PATTERN = re.compile(r"_|(?<!^)(?=[A-Z])")
+
 
 class GoExporter(Exporter):
     def export(self, data_contract, model, server, sql_server_type, export_args) -> dict:
@@ -39,8 +43,12 @@ def python_type_to_go_type(py_type) -> str:
             return "interface{}"
 
 
+@lru_cache(maxsize=4096)
 def to_camel_case(snake_str) -> str:
-    return "".join(word.capitalize() for word in re.split(r"_|(?<!^)(?=[A-Z])", snake_str))
+    if "_" not in snake_str and snake_str.islower():
+        # a single lowercase word, nothing to split
+        return snake_str.capitalize()
+    return "".join(word.capitalize() for word in _CAMEL_CASE_SPLIT_PATTERN.split(snake_str))
 
 
 def get_subtype(field_info, nested_types, type_name, camel_case_name) -> str:
@@ -13,11 +13,9 @@ class JsonSchemaExporter(Exporter):
 
 
 def to_jsonschemas(data_contract_spec: DataContractSpecification):
-    jsonschmemas = {}
-    for model_key, model_value in data_contract_spec.models.items():
-        jsonschema = to_jsonschema(model_key, model_value)
-        jsonschmemas[model_key] = jsonschema
-    return jsonschmemas
+    return {
+        model_key: to_jsonschema(model_key, model_value) for model_key, model_value in data_contract_spec.models.items()
+    }
 
 
 def to_jsonschema_json(model_key, model_value: Model) -> str:
@@ -26,10 +24,7 @@ def to_jsonschema_json(model_key, model_value: Model) -> str:
 
 
 def to_properties(fields: Dict[str, Field]) -> dict:
-    properties = {}
-    for field_name, field in fields.items():
-        properties[field_name] = to_property(field)
-    return properties
+    return {field_name: to_property(field) for field_name, field in fields.items()}
 
 
 def to_property(field: Field) -> dict:
@@ -83,11 +78,7 @@ def to_property(field: Field) -> dict:
 
 
 def to_required(fields: Dict[str, Field]):
-    required = []
-    for field_name, field in fields.items():
-        if field.required is True:
-            required.append(field_name)
-    return required
+    return [field_name for field_name, field in fields.items() if field.required is True]
 
 
 def convert_type_format(type, format) -> (str, str):
@@ -78,11 +78,7 @@ def to_odcs_table(model_key, model_value: Model) -> dict:
 
 
 def to_columns(fields: Dict[str, Field]) -> list:
-    columns = []
-    for field_name, field in fields.items():
-        column = to_column(field_name, field)
-        columns.append(column)
-    return columns
+    return [to_column(field_name, field) for field_name, field in fields.items()]
 
 
 def to_column(field_name: str, field: Field) -> dict:
@@ -98,27 +94,27 @@ def to_column(field_name: str, field: Field) -> dict:
         column["isUnique"] = field.unique
     if field.classification is not None:
         column["classification"] = field.classification
-    column["tags"] = []
+    tags = []
     if field.tags is not None:
-        column["tags"].extend(field.tags)
+        tags.extend(field.tags)
     if field.pii is not None:
-        column["tags"].append(f"pii:{str(field.pii).lower()}")
+        tags.append(f"pii:{str(field.pii).lower()}")
     if field.minLength is not None:
-        column["tags"].append(f"minLength:{field.minLength}")
+        tags.append(f"minLength:{field.minLength}")
     if field.maxLength is not None:
-        column["tags"].append(f"maxLength:{field.maxLength}")
+        tags.append(f"maxLength:{field.maxLength}")
     if field.pattern is not None:
-        column["tags"].append(f"pattern:{field.pattern}")
+        tags.append(f"pattern:{field.pattern}")
     if field.minimum is not None:
-        column["tags"].append(f"minimum:{field.minimum}")
+        tags.append(f"minimum:{field.minimum}")
     if field.maximum is not None:
-        column["tags"].append(f"maximum:{field.maximum}")
+        tags.append(f"maximum:{field.maximum}")
     if field.exclusiveMinimum is not None:
-        column["tags"].append(f"exclusiveMinimum:{field.exclusiveMinimum}")
+        tags.append(f"exclusiveMinimum:{field.exclusiveMinimum}")
     if field.exclusiveMaximum is not None:
-        column["tags"].append(f"exclusiveMaximum:{field.exclusiveMaximum}")
-    if not column["tags"]:
-        del column["tags"]
+        tags.append(f"exclusiveMaximum:{field.exclusiveMaximum}")
+    if tags:
+        column["tags"] = tags
 
     # todo enum
     return column
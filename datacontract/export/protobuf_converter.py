@@ -32,8 +32,7 @@ def to_protobuf_message(model_name, fields, description, indent_level: int = 0):
         result += f"""{indent(indent_level)}/* {description} */\n"""
 
     fields_protobuf = ""
-    number = 1
-    for field_name, field in fields.items():
+    for number, (field_name, field) in enumerate(fields.items(), start=1):
         if field.type in ["object", "record", "struct"]:
             fields_protobuf += (
                 "\n".join(
@@ -46,7 +45,6 @@ def to_protobuf_message(model_name, fields, description, indent_level: int = 0):
             )
 
         fields_protobuf += to_protobuf_field(field_name, field, field.description, number, 1) + "\n"
-        number += 1
     result += f"message {_to_protobuf_message_name(model_name)} {{\n{fields_protobuf}}}\n"
 
     return result
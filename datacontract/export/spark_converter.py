@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pyspark.sql import types
 from datacontract.model.data_contract_specification import (
     DataContractSpecification,
@@ -6,6 +8,27 @@ from datacontract.model.data_contract_specification import (
 )
 from datacontract.export.exporter import Exporter
 
+# Data contract types that map directly onto a Spark type without nested fields.
+_SCALAR_TYPES = {
+    "string": types.StringType,
+    "varchar": types.StringType,
+    "text": types.StringType,
+    "number": types.DecimalType,
+    "decimal": types.DecimalType,
+    "numeric": types.DecimalType,
+    "integer": types.IntegerType,
+    "int": types.IntegerType,
+    "long": types.LongType,
+    "float": types.FloatType,
+    "double": types.DoubleType,
+    "boolean": types.BooleanType,
+    "timestamp": types.TimestampType,
+    "timestamp_tz": types.TimestampType,
+    "timestamp_ntz": types.TimestampNTZType,
+    "date": types.DateType,
+    "bytes": types.BinaryType,
+}
+
 
 class SparkExporter(Exporter):
     """
@@ -123,29 +146,23 @@ def to_data_type(field: Field) -> types.DataType:
         return types.ArrayType(to_data_type(field.items))
     if field_type in ["object", "record", "struct"]:
         return types.StructType(to_struct_type(field.fields))
-    if field_type in ["string", "varchar", "text"]:
-        return types.StringType()
-    if field_type in ["number", "decimal", "numeric"]:
-        return types.DecimalType()
-    if field_type in ["integer", "int"]:
-        return types.IntegerType()
-    if field_type == "long":
-        return types.LongType()
-    if field_type == "float":
-        return types.FloatType()
-    if field_type == "double":
-        return types.DoubleType()
-    if field_type == "boolean":
-        return types.BooleanType()
-    if field_type in ["timestamp", "timestamp_tz"]:
-        return types.TimestampType()
-    if field_type == "timestamp_ntz":
-        return types.TimestampNTZType()
-    if field_type == "date":
-        return types.DateType()
-    if field_type == "bytes":
-        return types.BinaryType()
-    return types.BinaryType()
+    return _scalar_data_type(field_type)
+
+
+@lru_cache(maxsize=None)
+def _scalar_data_type(field_type: str) -> types.DataType:
+    """
+    Convert a scalar field type to a Spark DataType.
+
+    Spark scalar types are immutable, so a single instance is shared between all fields of the same type.
+
+    Args:
+        field_type (str): The data contract type of the field.
+
+    Returns:
+        types.DataType: The corresponding Spark DataType, BinaryType for unknown types.
+    """
+    return _SCALAR_TYPES.get(field_type, types.BinaryType)()
 
 
 def print_schema(dtype: types.DataType) -> str:
@@ -158,54 +175,79 @@ def print_schema(dtype: types.DataType) -> str:
     Returns:
         str: The code representation of the PySpark DataType schema.
     """
+    buffer = []
+    _write_data_type(dtype, 0, buffer)
+    return "".join(buffer)
 
-    def indent(text: str, level: int) -> str:
-        """
-        Indents each line of the given text by a specified number of levels.
 
-        Args:
-            text (str): The text to be indented.
-            level (int): The number of indentation levels.
+def _newline(level: int, buffer: list[str]) -> None:
+    """
+    Starts a new line in the buffer, indented by a specified number of levels.
 
-        Returns:
-            str: The indented text.
-        """
-        return "\n".join([f'{"    " * level}{line}' for line in text.split("\n")])
+    Args:
+        level (int): The number of indentation levels.
+        buffer (list[str]): The buffer the code representation is written to.
+    """
+    buffer.append(f'\n{"    " * level}')
 
-    def repr_column(column: types.StructField) -> str:
-        """
-        Converts a PySpark StructField to its code representation.
 
-        Args:
-            column (types.StructField): The StructField to be converted.
+def _write_column(column: types.StructField, level: int, buffer: list[str]) -> None:
+    """
+    Writes the code representation of a PySpark StructField to the buffer.
 
-        Returns:
-            str: The code representation of the StructField.
-        """
-        name = f'"{column.name}"'
-        data_type = indent(print_schema(column.dataType), 1)
-        nullable = indent(f"{column.nullable}", 1)
-        return f"StructField({name},\n{data_type},\n{nullable}\n)"
+    Args:
+        column (types.StructField): The StructField to be converted.
+        level (int): The indentation level of the StructField.
+        buffer (list[str]): The buffer the code representation is written to.
+    """
+    buffer.append(f'StructField("{column.name}",')
+    _newline(level + 1, buffer)
+    _write_data_type(column.dataType, level + 1, buffer)
+    buffer.append(",")
+    _newline(level + 1, buffer)
+    buffer.append(f"{column.nullable}")
+    _newline(level, buffer)
+    buffer.append(")")
 
-    def format_struct_type(struct_type: types.StructType) -> str:
-        """
-        Converts a PySpark StructType to its code representation.
 
-        Args:
-            struct_type (types.StructType): The StructType to be converted.
+def _write_struct_type(struct_type: types.StructType, level: int, buffer: list[str]) -> None:
+    """
+    Writes the code representation of a PySpark StructType to the buffer.
+
+    Args:
+        struct_type (types.StructType): The StructType to be converted.
+        level (int): The indentation level of the StructType.
+        buffer (list[str]): The buffer the code representation is written to.
+    """
+    buffer.append("StructType([")
+    for index, field in enumerate(struct_type.fields):
+        if index > 0:
+            buffer.append(",")
+        _newline(level + 1, buffer)
+        _write_column(field, level + 1, buffer)
+    if not struct_type.fields:
+        _newline(level, buffer)
+    _newline(level, buffer)
+    buffer.append("])")
 
-        Returns:
-            str: The code representation of the StructType.
-        """
-        fields = ",\n".join([indent(repr_column(field), 1) for field in struct_type.fields])
-        return f"StructType([\n{fields}\n])"
 
+def _write_data_type(dtype: types.DataType, level: int, buffer: list[str]) -> None:
+    """
+    Writes the code representation of a PySpark DataType to the buffer.
+
+    Args:
+        dtype (types.DataType): The DataType to be converted.
+        level (int): The indentation level of the DataType.
+        buffer (list[str]): The buffer the code representation is written to.
+    """
     if isinstance(dtype, types.StructType):
-        return format_struct_type(dtype)
+        _write_struct_type(dtype, level, buffer)
     elif isinstance(dtype, types.ArrayType):
-        return f"ArrayType({print_schema(dtype.elementType)})"
+        buffer.append("ArrayType(")
+        _write_data_type(dtype.elementType, level, buffer)
+        buffer.append(")")
     elif isinstance(dtype, types.DecimalType):
-        return f"DecimalType({dtype.precision}, {dtype.scale})"
+        buffer.append(f"DecimalType({dtype.precision}, {dtype.scale})")
     else:
         dtype_str = str(dtype)
-        return dtype_str if dtype_str.endswith("()") else f"{dtype_str}()"
+        buffer.append(dtype_str if dtype_str.endswith("()") else f"{dtype_str}()")
@@ -90,43 +90,43 @@ def to_sql_ddl(
         if server.type == server_type:
             break
 
-    result = ""
-    result += f"-- Data Contract: {data_contract_spec.id}\n"
-    result += f"-- SQL Dialect: {server_type}\n"
+    result = [
+        f"-- Data Contract: {data_contract_spec.id}\n",
+        f"-- SQL Dialect: {server_type}\n",
+    ]
 
     for model_name, model in iter(data_contract_spec.models.items()):
-        result += _to_sql_table(table_prefix + model_name, model, server_type)
+        result.append(_to_sql_table(table_prefix + model_name, model, server_type))
 
-    return result.strip()
+    return "".join(result).strip()
 
 
 def _to_sql_table(model_name, model, server_type="snowflake"):
     if server_type == "databricks":
         # Databricks recommends to use the CREATE OR REPLACE statement for unity managed tables
         # https://docs.databricks.com/en/sql/language-manual/sql-ref-syntax-ddl-create-table-using.html
-        result = f"CREATE OR REPLACE TABLE {model_name} (\n"
+        result = [f"CREATE OR REPLACE TABLE {model_name} (\n"]
     else:
-        result = f"CREATE TABLE {model_name} (\n"
-    fields = len(model.fields)
-    current_field_index = 1
+        result = [f"CREATE TABLE {model_name} (\n"]
+    columns = []
     for field_name, field in iter(model.fields.items()):
         type = convert_to_sql_type(field, server_type)
-        result += f"  {field_name} {type}"
+        column = f"  {field_name} {type}"
         if field.required:
-            result += " not null"
+            column += " not null"
         if field.primary:
-            result += " primary key"
+            column += " primary key"
         if server_type == "databricks" and field.description is not None:
-            result += f' COMMENT "{_escape(field.description)}"'
-        if current_field_index < fields:
-            result += ","
-        result += "\n"
-        current_field_index += 1
-    result += ")"
+            column += f' COMMENT "{_escape(field.description)}"'
+        columns.append(column)
+    if columns:
+        result.append(",\n".join(columns))
+        result.append("\n")
+    result.append(")")
     if server_type == "databricks" and model.description is not None:
-        result += f' COMMENT "{_escape(model.description)}"'
-    result += ";\n"
-    return result
+        result.append(f' COMMENT "{_escape(model.description)}"')
+    result.append(";\n")
+    return "".join(result)
 
 
 def _escape(text: str | None) -> str | None:
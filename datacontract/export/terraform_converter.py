@@ -3,6 +3,9 @@ import re
 from datacontract.model.data_contract_specification import DataContractSpecification, Server
 from datacontract.export.exporter import Exporter
 
+# Regular expression to match the S3 bucket name
+_S3_BUCKET_NAME_PATTERN = re.compile(r"s3://([^/]+)/")
+
 
 class TerraformExporter(Exporter):
     def export(self, data_contract, model, server, sql_server_type, export_args) -> dict:
@@ -65,8 +68,7 @@ resource "aws_s3_bucket" "{resource_id}" {{
 def extract_bucket_name(server) -> str | None:
     if server.type == "s3":
         s3_url = server.location
-        # Regular expression to match the S3 bucket name
-        match = re.search(r"s3://([^/]+)/", s3_url)
+        match = _S3_BUCKET_NAME_PATTERN.search(s3_url)
         if match:
             # Return the first group (bucket name)
             return match.group(1)
@@ -131,38 +131,41 @@ def import_table_fields(table_fields):
     imported_fields = {}
     for field in table_fields:
         field_name = field.get("name")
-        imported_fields[field_name] = Field()
-        imported_fields[field_name].required = field.get("mode") == "REQUIRED"
-        imported_fields[field_name].description = field.get("description")
-
-        if field.get("type") == "RECORD":
-            imported_fields[field_name].type = "object"
-            imported_fields[field_name].fields = import_table_fields(field.get("fields"))
-        elif field.get("type") == "STRUCT":
-            imported_fields[field_name].type = "struct"
-            imported_fields[field_name].fields = import_table_fields(field.get("fields"))
-        elif field.get("type") == "RANGE":
+        field_type = field.get("type")
+        imported_field = Field()
+        imported_fields[field_name] = imported_field
+        imported_field.required = field.get("mode") == "REQUIRED"
+        imported_field.description = field.get("description")
+
+        if field_type == "RECORD":
+            imported_field.type = "object"
+            imported_field.fields = import_table_fields(field.get("fields"))
+        elif field_type == "STRUCT":
+            imported_field.type = "struct"
+            imported_field.fields = import_table_fields(field.get("fields"))
+        elif field_type == "RANGE":
             # This is a range of date/datetime/timestamp but multiple values
             # So we map it to an array
-            imported_fields[field_name].type = "array"
-            imported_fields[field_name].items = Field(
-                type=map_type_from_bigquery(field["rangeElementType"].get("type"))
-            )
+            imported_field.type = "array"
+            imported_field.items = Field(type=map_type_from_bigquery(field["rangeElementType"].get("type")))
         else:  # primitive type
-            imported_fields[field_name].type = map_type_from_bigquery(field.get("type"))
+            imported_field.type = map_type_from_bigquery(field_type)
 
-        if field.get("type") == "STRING":
+        if field_type == "STRING":
             # in bigquery both string and bytes have maxLength but in the datacontracts
             # spec it is only valid for strings
-            if field.get("maxLength") is not None:
-                imported_fields[field_name].maxLength = int(field.get("maxLength"))
-
-        if field.get("type") == "NUMERIC" or field.get("type") == "BIGNUMERIC":
-            if field.get("precision") is not None:
-                imported_fields[field_name].precision = int(field.get("precision"))
-
-            if field.get("scale") is not None:
-                imported_fields[field_name].scale = int(field.get("scale"))
+            max_length = field.get("maxLength")
+            if max_length is not None:
+                imported_field.maxLength = int(max_length)
+
+        if field_type == "NUMERIC" or field_type == "BIGNUMERIC":
+            precision = field.get("precision")
+            if precision is not None:
+                imported_field.precision = int(precision)
+
+            scale = field.get("scale")
+            if scale is not None:
+                imported_field.scale = int(scale)
 
     return imported_fields
 
@@ -54,11 +54,20 @@ def create_fields(columns: List):
 
 
 def read_dbt_manifest(manifest_path: str):
-    with open(manifest_path, "r", encoding="utf-8") as f:
-        manifest = json.load(f)
+    with open(manifest_path, "rb") as f:
+        manifest = _parse_json(f.read())
     return {"info": manifest.get("metadata"), "models": create_manifest_models(manifest)}
 
 
+def _parse_json(content: bytes) -> dict:
+    # manifest files of larger dbt projects easily reach tens of megabytes, use orjson if it is installed
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
 def create_manifest_models(manifest: dict) -> List:
     models = []
     nodes = manifest.get("nodes")
@@ -144,10 +144,10 @@ def import_glue(
         "production": Server(type="glue", account=catalogid, database=source, location=location_uri),
     }
 
-    for table_name in table_names:
-        if data_contract_specification.models is None:
-            data_contract_specification.models = {}
+    if data_contract_specification.models is None:
+        data_contract_specification.models = {}
 
+    for table_name in table_names:
         table_schema = get_glue_table_schema(source, table_name)
 
         fields = {}
@@ -194,11 +194,11 @@ def create_typed_field(dtype: str) -> Field:
         elif dtype.startswith("struct"):
             field.type = "struct"
             for f in split_struct(orig_dtype[7:-1]):
-                field.fields[f.split(":", 1)[0].strip()] = create_typed_field(f.split(":", 1)[1])
+                sub_field_name, sub_field_type = f.split(":", 1)
+                field.fields[sub_field_name.strip()] = create_typed_field(sub_field_type)
         elif dtype.startswith("map"):
             field.type = "map"
-            key_type = orig_dtype[4:-1].split(",", 1)[0]
-            value_type = orig_dtype[4:-1].split(",", 1)[1]
+            key_type, value_type = orig_dtype[4:-1].split(",", 1)
             field.keys = create_typed_field(key_type)
             field.values = create_typed_field(value_type)
     else:
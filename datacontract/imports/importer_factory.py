@@ -15,8 +15,7 @@ class ImporterFactory:
         self.dict_lazy_importer.update({name: (module_path, class_name)})
 
     def create(self, name) -> Importer:
-        importers = self.dict_importer.copy()
-        importers.update(self.dict_lazy_importer.copy())
+        importers = {**self.dict_importer, **self.dict_lazy_importer}
         if name not in importers.keys():
             raise ValueError(f"The '{name}' format is not supported.")
         importer_class = importers[name]
@@ -158,16 +158,17 @@ def import_fields(odcs_columns: Dict[str, Any], custom_type_mappings: Dict[str,
     for column in odcs_columns:
         mapped_type = map_type(column.get("logicalType"), custom_type_mappings)
         if mapped_type is not None:
-            description = column.get("description") if column.get("description") is not None else ""
+            description = column.get("description") or ""
+            is_nullable = column.get("isNullable")
             field = Field(
                 description=" ".join(description.splitlines()),
                 type=mapped_type,
-                title=column.get("businessName") if column.get("businessName") is not None else "",
-                required=not column.get("isNullable") if column.get("isNullable") is not None else False,
-                primary=column.get("isPrimary") if column.get("isPrimary") is not None else False,
-                unique=column.get("isUnique") if column.get("isUnique") is not None else False,
-                classification=column.get("classification") if column.get("classification") is not None else "",
-                tags=column.get("tags") if column.get("tags") is not None else [],
+                title=column.get("businessName") or "",
+                required=not is_nullable if is_nullable is not None else False,
+                primary=column.get("isPrimary") or False,
+                unique=column.get("isUnique") or False,
+                classification=column.get("classification") or "",
+                tags=column.get("tags") or [],
             )
             result[column["column"]] = field
         else:
@@ -193,7 +194,7 @@ def get_custom_type_mappings(odcs_custom_properties: List[Any]) -> Dict[str, str
     if odcs_custom_properties is not None:
         for prop in odcs_custom_properties:
             if prop["property"].startswith("dc_mapping_"):
-                odcs_type_name = prop["property"].substring(11)
+                odcs_type_name = prop["property"][len("dc_mapping_") :]
                 datacontract_type = prop["value"]
                 result[odcs_type_name] = datacontract_type
 
@@ -41,7 +41,7 @@ def resolve_data_contract(
 def resolve_data_contract_from_location(
     location, schema_location: str = None, inline_definitions: bool = False, inline_quality: bool = False
 ) -> DataContractSpecification:
-    if location.startswith("http://") or location.startswith("https://"):
+    if location.startswith(("http://", "https://")):
         data_contract_str = fetch_resource(location)
     else:
         data_contract_str = read_file(location)
@@ -49,13 +49,18 @@ def resolve_data_contract_from_location(
 
 
 def inline_definitions_into_data_contract(spec: DataContractSpecification):
+    # many fields share the same definition, so every ref is only fetched and parsed once
+    resolved_definitions = {}
     for model in spec.models.values():
         for field in model.fields.values():
             # If ref_obj is not empty, we've already inlined definitions.
             if not field.ref and not field.ref_obj:
                 continue
 
-            definition = _resolve_definition_ref(field.ref, spec)
+            definition = resolved_definitions.get(field.ref)
+            if definition is None:
+                definition = _resolve_definition_ref(field.ref, spec)
+                resolved_definitions[field.ref] = definition
             field.ref_obj = definition
 
             for field_name in field.model_fields.keys():
@@ -70,29 +75,26 @@ def inline_definitions_into_data_contract(spec: DataContractSpecification):
 def _resolve_definition_ref(ref, spec) -> Definition:
     logging.info(f"Resolving definition ref {ref}")
 
-    if "#" in ref:
-        path, definition_path = ref.split("#")
-    else:
-        path, definition_path = ref, None
+    path, _, definition_path = ref.partition("#")
 
-    if path.startswith("http://") or path.startswith("https://"):
+    if path.startswith(("http://", "https://")):
         logging.info(f"Resolving definition url {path}")
 
         definition_str = fetch_resource(path)
         definition_dict = _to_yaml(definition_str)
         definition = Definition(**definition_dict)
-        if definition_path is not None:
+        if definition_path:
             return _find_by_path_in_definition(definition_path, definition)
         else:
             return definition
     elif path.startswith("file://"):
         logging.info(f"Resolving definition file path {path}")
 
-        path = path.replace("file://", "")
+        path = path.removeprefix("file://")
         definition_str = _fetch_file(path)
         definition_dict = _to_yaml(definition_str)
         definition = Definition(**definition_dict)
-        if definition_path is not None:
+        if definition_path:
             return _find_by_path_in_definition(definition_path, definition)
         else:
             return definition
@@ -7,6 +7,7 @@ from typer.testing import CliRunner
 
 from datacontract.cli import app
 from datacontract.data_contract import DataContract
+from datacontract.imports.odcs_importer import get_custom_type_mappings
 
 logging.basicConfig(level=logging.DEBUG, force=True)
 
@@ -40,6 +41,14 @@ def test_import_complex_odcs():
     assert DataContract(data_contract_str=expected_datacontract).lint(enabled_linters="none").has_passed()
 
 
+def test_import_custom_type_mappings():
+    custom_properties = [
+        {"property": "dc_mapping_uuid", "value": "string"},
+        {"property": "refRulesetName", "value": "gcsc.ruleset.name"},
+    ]
+    assert get_custom_type_mappings(custom_properties) == {"uuid": "string"}
+
+
 def read_file(file):
     if not os.path.exists(file):
         print(f"The file '{file}' does not exist.")